@@ -7,16 +7,105 @@ No more command line nonsense!
 
 Requirements:
 - pip install ollama pillow
+  (or pillow-simd on x86_64 CPUs with AVX2 for faster previews)
 - Ollama running locally with any vision model
 """
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import ollama
-import base64
+import httpx
+import logging
 import os
+import platform
+import re
 import threading
-from PIL import Image, ImageTk
+import concurrent.futures
+import io
+import time
+import urllib.parse
+import queue
+from collections import OrderedDict, deque
+
+log = logging.getLogger(__name__)
+
+# Keep connections to the Ollama server alive between requests
+KEEPALIVE_LIMITS = httpx.Limits(max_keepalive_connections=4, keepalive_expiry=30)
+
+# Seconds to wait for a connection to the Ollama server before giving up
+CONNECT_TIMEOUT = 2.0
+
+# Fail fast when the server is unreachable, but let generation take as long as it needs
+CLIENT_TIMEOUT = httpx.Timeout(None, connect=CONNECT_TIMEOUT)
+
+# Longest image edge (px) worth sending to each model family; larger images
+# are downscaled client-side since the model resizes them to its patch grid anyway
+MODEL_MAX_EDGE = {
+    'llava': 672,
+    'moondream': 756,
+    'qwen2.5vl': 1344,
+}
+
+# Longest image edge (px) sent to models not listed in MODEL_MAX_EDGE
+DEFAULT_MAX_EDGE = 1024
+
+# Seconds between flushes of streamed response text into the GUI
+STREAM_FLUSH_INTERVAL = 0.05
+
+# File extensions accepted for drag & drop
+VALID_IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff'})
+
+# Maximum number of image previews kept in memory; Tk holds every preview as
+# 32-bit pixels (~90 KB at 150x150), so this caps previews at about 1.5 MB
+PREVIEW_CACHE_SIZE = 16
+
+def resolve_ollama_url(host=None):
+    """Base URL for host, falling back to OLLAMA_HOST and Ollama's default address"""
+    host = host or os.environ.get('OLLAMA_HOST') or '127.0.0.1:11434'
+    
+    # Like the ollama client: a bare host defaults to port 11434, an explicit
+    # scheme without a port uses that scheme's default port
+    if '://' in host:
+        scheme, host = host.split('://', 1)
+        default_port = 443 if scheme == 'https' else 80
+    else:
+        scheme, default_port = 'http', 11434
+    
+    parts = urllib.parse.urlsplit(f"{scheme}://{host}")
+    hostname = parts.hostname or '127.0.0.1'
+    if ':' in hostname:  # IPv6 literal
+        hostname = f"[{hostname}]"
+    return f"{scheme}://{hostname}:{parts.port or default_port}{parts.path.rstrip('/')}"
+
+
+def ollama_num_parallel():
+    """Number of requests the Ollama server handles concurrently (OLLAMA_NUM_PARALLEL)"""
+    try:
+        return max(1, int(os.environ.get('OLLAMA_NUM_PARALLEL', 1)))
+    except ValueError:
+        return 1
+
+
+def submit_daemon(fn, *args):
+    """Run fn(*args) on a daemon thread and return a Future for its result
+    
+    Unlike ThreadPoolExecutor workers, daemon threads don't keep the process
+    alive at exit, so a long-running request can't hold the app open after
+    its window has closed.
+    """
+    future = concurrent.futures.Future()
+    
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+    
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
 
 # Try to import drag and drop support
 try:
@@ -27,6 +116,9 @@ except ImportError:
 
 
 class VisionModelGUI:
+    # Name fragments that mark a model as likely vision-capable
+    _VISION_RE = re.compile(r'llava|vision|clip|moondream|qwen2\.5v[il]|bakllava', re.IGNORECASE)
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Ollama Vision Model Analyzer")
@@ -36,12 +128,24 @@ class VisionModelGUI:
         # Initialize Ollama client - try different connection methods
         self.client = None
         self.selected_image_path = None
+        self.selected_image_paths = []  # All selected images; more than one means a batch
         self.model_names = []  # Store actual model names separately from display names
         self.successful_connection = None  # Store successful connection parameters
+        self._preview_cache = OrderedDict()  # (path, mtime) -> PhotoImage, LRU order
+        self._imaging_backend_checked = False
+        
+        # Worker pool for image preparation, so the GUI never blocks; the
+        # inference itself runs on daemon threads (see submit_daemon)
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._current_future = None  # Pending analysis, if any
         
         self.setup_ui()
         self.setup_drag_and_drop()
-        self.initialize_ollama_client()
+        
+        # Connect once the window has been drawn, so first paint doesn't wait on it
+        self.root.after(50, self.initialize_ollama_client)
+        
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         
     def setup_ui(self):
         """Create the user interface"""
@@ -86,19 +190,6 @@ class VisionModelGUI:
         
         canvas.bind('<Configure>', configure_canvas_width)
         
-        # Bind mousewheel to canvas for scrolling
-        def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        
-        def bind_mousewheel(event):
-            canvas.bind_all("<MouseWheel>", _on_mousewheel)
-        
-        def unbind_mousewheel(event):
-            canvas.unbind_all("<MouseWheel>")
-        
-        canvas.bind('<Enter>', bind_mousewheel)
-        canvas.bind('<Leave>', unbind_mousewheel)
-        
         # Title
         title_label = ttk.Label(main_frame, text="🖼️ Ollama Vision Model Analyzer", 
                                font=('Arial', 16, 'bold'))
@@ -174,6 +265,28 @@ class VisionModelGUI:
         copy_btn = ttk.Button(response_frame, text="📋 Copy Response", 
                              command=self.copy_response)
         copy_btn.grid(row=1, column=0, pady=(10, 0))
+        
+        # Mousewheel scrolling for the canvas
+        def _on_mousewheel(event):
+            if event.num == 4:  # Linux scroll up
+                canvas.yview_scroll(-1, "units")
+            elif event.num == 5:  # Linux scroll down
+                canvas.yview_scroll(1, "units")
+            else:
+                canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+        
+        # Bind once on every widget in the canvas instead of toggling bind_all on
+        # Enter/Leave; text areas, their scrollbars and the combobox keep their
+        # own wheel handling
+        def bind_mousewheel(widget):
+            if isinstance(widget, (tk.Text, ttk.Combobox, tk.Scrollbar, ttk.Scrollbar)):
+                return
+            for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+                widget.bind(sequence, _on_mousewheel, add='+')
+            for child in widget.winfo_children():
+                bind_mousewheel(child)
+        
+        bind_mousewheel(canvas)
     
     def setup_drag_and_drop(self):
         """Setup drag and drop functionality for image files"""
@@ -193,22 +306,16 @@ class VisionModelGUI:
         def drop(event):
             self.preview_frame.configure(relief="groove")
             
-            # Get the dropped files
+            # Get the dropped files and keep only the image files
             files = self.root.tk.splitlist(event.data)
-            if files:
-                file_path = files[0]
-                
-                # Check if it's an image file
-                valid_extensions = ('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff')
-                if file_path.lower().endswith(valid_extensions):
-                    self.selected_image_path = file_path
-                    display_name = os.path.basename(file_path)
-                    self.image_path_var.set(display_name)
-                    self.image_label.configure(foreground="black")
-                    self.show_image_preview(file_path)
-                else:
-                    messagebox.showerror("Invalid File", 
-                                       "Please drop a valid image file (JPG, PNG, GIF, BMP, TIFF)")
+            image_paths = [file_path for file_path in files 
+                           if os.path.splitext(file_path)[1].lower() in VALID_IMAGE_EXTENSIONS]
+            
+            if image_paths:
+                self.select_images(image_paths)
+            elif files:
+                messagebox.showerror("Invalid File", 
+                                   "Please drop a valid image file (JPG, PNG, GIF, BMP, TIFF)")
             return "copy"
         
         # Enable drag and drop
@@ -223,8 +330,35 @@ class VisionModelGUI:
         self.preview_label.dnd_bind("<<DropLeave>>", drop_leave)
         self.preview_label.dnd_bind("<<Drop>>", drop)
     
+    def check_imaging_backend(self):
+        """Warn if the image previews aren't using an accelerated Pillow build"""
+        self._imaging_backend_checked = True
+        if platform.machine().lower() not in ('x86_64', 'amd64'):
+            return
+        
+        import PIL
+        from PIL import features
+        
+        # Pillow-SIMD releases carry a ".postN" version suffix
+        if '.post' not in PIL.__version__:
+            log.warning("Plain Pillow %s detected; install pillow-simd for faster image previews",
+                        PIL.__version__)
+        if not features.check_feature('libjpeg_turbo'):
+            log.warning("Pillow was built without libjpeg-turbo; JPEG decoding will be slower")
+    
+    def create_client(self, host=None):
+        """Create an Ollama client that keeps its HTTP connections alive"""
+        if host:
+            return ollama.Client(host=host, timeout=CLIENT_TIMEOUT, limits=KEEPALIVE_LIMITS)
+        return ollama.Client(timeout=CLIENT_TIMEOUT, limits=KEEPALIVE_LIMITS)
+    
     def initialize_ollama_client(self):
-        """Initialize Ollama client with different connection attempts"""
+        """Initialize Ollama client, probing all connection attempts in the background"""
+        self.update_status("🔄 Connecting to Ollama...")
+        threading.Thread(target=self._probe_connections, daemon=True).start()
+    
+    def _probe_connections(self):
+        """Probe all connection attempts in parallel and keep the first that works, in list order"""
         connection_attempts = [
             ("http://localhost:11434", "Default port 11434"),
             ("http://127.0.0.1:11434", "Localhost IP with port 11434"),
@@ -232,25 +366,51 @@ class VisionModelGUI:
             (None, "Default client configuration")
         ]
         
-        for host, description in connection_attempts:
-            try:
-                if host:
-                    self.client = ollama.Client(host=host)
-                else:
-                    self.client = ollama.Client()
+        # Share one HTTP client across all probes instead of one socket per attempt
+        with httpx.Client(timeout=CONNECT_TIMEOUT) as probe, \
+                concurrent.futures.ThreadPoolExecutor(max_workers=len(connection_attempts)) as pool:
+            futures = [pool.submit(self._probe_host, probe, host) 
+                       for host, _ in connection_attempts]
+            
+            # All probes run at once, but the result is picked in priority order,
+            # so a later fallback never wins just by answering sooner
+            for index, (future, (host, description)) in enumerate(zip(futures, connection_attempts)):
+                try:
+                    client = future.result()
+                except Exception as e:
+                    self.root.after(0, self.update_status, 
+                                    f"❌ Failed {description}: {str(e)[:50]}...")
+                    continue
                 
-                # Test the connection by trying to list models
-                models = self.client.list()
-                self.successful_connection = host  # Store successful connection
-                self.update_status(f"✅ Connected via {description}")
-                self.load_available_models()
+                # Drop the lower-priority probes that haven't started
+                for other in futures[index + 1:]:
+                    other.cancel()
+                self.root.after(0, self._on_client_connected, client, host, description)
                 return
-                
-            except Exception as e:
-                self.update_status(f"❌ Failed {description}: {str(e)[:50]}...")
-                continue
         
         # If all attempts failed
+        self.root.after(0, self._on_connection_failed)
+    
+    def _probe_host(self, probe, host):
+        """Return a client for host if an Ollama server answers there (runs on a worker thread)"""
+        # Test the connection with a lightweight request only Ollama answers this way
+        response = probe.get(f"{resolve_ollama_url(host)}/api/version")
+        response.raise_for_status()
+        version = response.json()
+        if not isinstance(version, dict) or 'version' not in version:
+            raise ValueError("Server is not Ollama")
+        
+        return self.create_client(host)
+    
+    def _on_client_connected(self, client, host, description):
+        """Use a client that passed the connection probe"""
+        self.client = client
+        self.successful_connection = host  # Store successful connection
+        self.update_status(f"✅ Connected via {description}")
+        self.load_available_models()
+    
+    def _on_connection_failed(self):
+        """Report that no connection attempt succeeded"""
         self.client = None
         self.successful_connection = None
         error_msg = ("Could not connect to Ollama server.\n\n"
@@ -263,40 +423,45 @@ class VisionModelGUI:
         messagebox.showerror("Connection Failed", error_msg)
         self.update_status("❌ No connection to Ollama")
         
-    def load_available_models(self):
-        """Load all available models from Ollama"""
+    def load_available_models(self, models_response=None):
+        """Load all available models from Ollama (or from an already fetched list)"""
         if not self.client:
             self.update_status("❌ No Ollama connection")
             return
             
         try:
-            models_response = self.client.list()
+            if models_response is None:
+                models_response = self.client.list()
             
             # Get all models - let user choose
             all_models = []
-            vision_indicators = ['llava', 'vision', 'vi', 'clip', 'moondream', 'qwen2.5vi', 'bakllava']
             
             # Handle different possible response structures
-            if isinstance(models_response, dict):
-                models_list = models_response.get('models', [])
-            elif hasattr(models_response, 'models'):
-                models_list = models_response.models
+            models_list = getattr(models_response, 'models', None)
+            if models_list is None:
+                if isinstance(models_response, dict):
+                    models_list = models_response.get('models', [])
+                else:
+                    models_list = models_response
+            models_list = list(models_list)
+            
+            # Pick how to extract the model name once, from the first entry
+            first = models_list[0] if models_list else None
+            if hasattr(first, 'model'):
+                extract_name = lambda m: m.model  # For model objects
+            elif isinstance(first, dict):
+                extract_name = lambda m: m.get('name') or m.get('model')
             else:
-                models_list = models_response
+                extract_name = str
             
             for model in models_list:
                 try:
                     # Extract just the model name string
-                    if hasattr(model, 'model'):
-                        model_name = model.model  # For model objects
-                    elif isinstance(model, dict):
-                        model_name = model.get('name') or model.get('model')
-                    else:
-                        model_name = str(model)
+                    model_name = extract_name(model)
                     
                     if model_name:
                         # Check if it's likely a vision model for sorting
-                        is_vision = any(indicator in model_name.lower() for indicator in vision_indicators)
+                        is_vision = bool(self._VISION_RE.search(model_name))
                         
                         all_models.append({
                             'name': model_name,
@@ -304,7 +469,7 @@ class VisionModelGUI:
                         })
                             
                 except Exception as model_error:
-                    print(f"DEBUG - Error processing model: {model}, Error: {model_error}")
+                    log.debug("Error processing model: %s, Error: %s", model, model_error)
                     continue
             
             # Sort models with vision models first
@@ -335,7 +500,7 @@ class VisionModelGUI:
                 
         except Exception as e:
             self.update_status(f"❌ Error loading models: {e}")
-            print(f"DEBUG - Full error: {e}")
+            log.debug("Full error: %s", e)
             
             messagebox.showerror("Model Loading Error", 
                                f"Could not load models: {e}\n\n"
@@ -348,15 +513,12 @@ class VisionModelGUI:
         # If we have a known successful connection, try that first
         if self.successful_connection:
             try:
-                if self.successful_connection:
-                    self.client = ollama.Client(host=self.successful_connection)
-                else:
-                    self.client = ollama.Client()
+                self.client = self.create_client(self.successful_connection)
                 
-                # Test the connection
-                models = self.client.list()
+                # Test the connection; the model list doubles as the health check
+                models_response = self.client.list()
                 self.update_status("✅ Reconnected successfully")
-                self.load_available_models()
+                self.load_available_models(models_response)
                 return
                 
             except Exception as e:
@@ -380,24 +542,53 @@ class VisionModelGUI:
         )
         
         if filename:
-            self.selected_image_path = filename
+            self.select_images([filename])
+    
+    def select_images(self, image_paths):
+        """Select one or more images for analysis and preview the first"""
+        self.selected_image_paths = list(image_paths)
+        self.selected_image_path = self.selected_image_paths[0]
+        
+        if len(self.selected_image_paths) > 1:
+            display_name = f"{len(self.selected_image_paths)} images selected"
+        else:
             # Show just the filename, not the full path
-            display_name = os.path.basename(filename)
-            self.image_path_var.set(display_name)
-            self.image_label.configure(foreground="black")
-            self.show_image_preview(filename)
+            display_name = os.path.basename(self.selected_image_path)
+        self.image_path_var.set(display_name)
+        self.image_label.configure(foreground="black")
+        self.show_image_preview(self.selected_image_path)
     
     def show_image_preview(self, image_path):
         """Show a preview of the selected image"""
+        # Imported here so startup doesn't pay for PIL until an image is picked
+        from PIL import Image, ImageTk
+        
+        if not self._imaging_backend_checked:
+            self.check_imaging_backend()
+        
         try:
-            # Open and resize image for preview
-            image = Image.open(image_path)
-            
-            # Calculate size to fit in preview area (max 150x150 to save space)
-            image.thumbnail((150, 150), Image.Resampling.LANCZOS)
+            # Reuse the cached preview if the file hasn't changed
+            cache_key = (image_path, os.path.getmtime(image_path))
+            photo = self._preview_cache.get(cache_key)
             
-            # Convert to PhotoImage
-            photo = ImageTk.PhotoImage(image)
+            if photo is not None:
+                self._preview_cache.move_to_end(cache_key)
+            else:
+                # Open and resize image for preview, releasing the file and the
+                # decoded pixels as soon as the PhotoImage has its own copy
+                with Image.open(image_path) as image:
+                    # Let JPEGs decode at reduced resolution straight from the IDCT
+                    image.draft('RGB', (300, 300))
+                    
+                    # Calculate size to fit in preview area (max 150x150 to save space)
+                    image.thumbnail((150, 150), Image.Resampling.LANCZOS)
+                    
+                    # Convert to PhotoImage
+                    photo = ImageTk.PhotoImage(image)
+                
+                self._preview_cache[cache_key] = photo
+                if len(self._preview_cache) > PREVIEW_CACHE_SIZE:
+                    self._preview_cache.popitem(last=False)
             
             # Update preview label
             self.preview_label.configure(image=photo, text="")
@@ -407,8 +598,11 @@ class VisionModelGUI:
             self.preview_label.configure(image="", text=f"Preview error: {e}")
     
     def analyze_image_threaded(self):
-        """Run image analysis in a separate thread to avoid freezing the GUI"""
-        threading.Thread(target=self.analyze_image, daemon=True).start()
+        """Start image analysis on the worker pool, or cancel the one in progress"""
+        if self._current_future is not None:
+            self.cancel_analysis()
+        else:
+            self.analyze_image()
     
     def analyze_image(self):
         """Analyze the selected image with the prompt"""
@@ -428,51 +622,278 @@ class VisionModelGUI:
             messagebox.showerror("No Model", "Please select a vision model.")
             return
         
-        prompt = self.prompt_text.get(1.0, tk.END).strip()
+        # Read on the main thread; workers get the prompt as an argument
+        # ('end-1c' skips the newline Tk always appends)
+        prompt = self.prompt_text.get('1.0', 'end-1c').strip()
         if not prompt:
             messagebox.showerror("No Prompt", "Please enter a prompt.")
             return
         
-        # Show progress
+        # Get the selected model name directly
+        selected_model = self.model_var.get().strip()
+        
+        log.debug("Using model: %r (type: %s)", selected_model, type(selected_model))
+        
+        # Show progress and turn the analyze button into a cancel button
         self.progress.start()
-        self.analyze_btn.configure(state="disabled", text="🔍 Analyzing...")
+        self.analyze_btn.configure(text="✖ Cancel")
         self.response_text.delete(1.0, tk.END)
+        
+        if len(self.selected_image_paths) > 1:
+            self.response_text.insert(
+                tk.END, f"Analyzing {len(self.selected_image_paths)} images, please wait..."
+            )
+            self.analyze_batch(self.selected_image_paths, prompt, selected_model)
+            return
+        
         self.response_text.insert(tk.END, "Analyzing image, please wait...")
         
+        # Tracks this analysis for the GUI; cancelling it tells the workers to stop
+        analysis_future = concurrent.futures.Future()
+        self._current_future = analysis_future
+        self._response_started = False
+        
+        # Read the image on the worker pool and stream the inference on a daemon thread
+        encode_future = self._executor.submit(self._prepare_image_for_model, 
+                                              self.selected_image_path, selected_model)
+        infer_future = submit_daemon(self._stream_infer, encode_future, 
+                                     prompt, selected_model, analysis_future)
+        infer_future.add_done_callback(
+            lambda f: self.root.after(0, self._on_infer_done, analysis_future, f)
+        )
+    
+    def _prepare_image_for_model(self, image_path, model_name):
+        """Return the image bytes to send, downscaled if larger than the model uses"""
+        from PIL import Image, ImageOps
+        
+        max_edge = next((edge for family, edge in MODEL_MAX_EDGE.items() 
+                         if family in model_name.lower()), DEFAULT_MAX_EDGE)
+        
+        try:
+            with Image.open(image_path) as image:
+                # High bit-depth images would be clipped, not scaled, into 8 bits -
+                # send those as they are
+                if max(image.size) > max_edge and not image.mode.startswith(('I', 'F')):
+                    # Let JPEGs decode at reduced resolution before resampling
+                    image.draft('RGB', (max_edge * 2, max_edge * 2))
+                    
+                    # Resample in a mode LANCZOS supports, keeping any transparency
+                    # (palette and 1-bit images would otherwise use nearest-neighbour)
+                    has_alpha = (image.mode in ('RGBA', 'LA', 'PA') or 
+                                 (image.mode == 'P' and 'transparency' in image.info))
+                    if image.mode not in ('RGB', 'RGBA', 'L'):
+                        image = image.convert('RGBA' if has_alpha else 'RGB')
+                    
+                    image.thumbnail((max_edge, max_edge), Image.Resampling.LANCZOS)
+                    
+                    # Re-encoding drops EXIF, so apply the orientation to the pixels
+                    image = ImageOps.exif_transpose(image)
+                    
+                    # JPEG has no alpha - put transparent areas on white, not on
+                    # whatever color values happen to sit under them
+                    if has_alpha:
+                        background = Image.new('RGBA', image.size, (255, 255, 255, 255))
+                        image = Image.alpha_composite(background, image)
+                    image = image.convert('RGB')
+                    
+                    buffer = io.BytesIO()
+                    image.save(buffer, format='JPEG', quality=85, optimize=True)
+                    return buffer.getvalue()
+        
+        except Exception as e:
+            # Downscaling is only an optimization - never let it fail the analysis
+            log.debug("Could not downscale %s, sending original: %s", image_path, e)
+        
+        # Small enough already (or not downscalable) - send the original file
+        # untouched (the ollama client does the base64 encoding)
+        with open(image_path, 'rb') as image_file:
+            return image_file.read()
+    
+    def _run_infer(self, encode_future, prompt, model, batch_future):
+        """Send the encoded image to the vision model (runs on a worker thread)"""
+        image_bytes = encode_future.result()
+        
+        # Don't start a generation the user has already cancelled
+        if batch_future.cancelled():
+            raise concurrent.futures.CancelledError()
+        
+        return self.client.generate(
+            model=model,
+            prompt=prompt,
+            images=[image_bytes],
+            stream=False
+        )
+    
+    def _stream_infer(self, encode_future, prompt, model, analysis_future):
+        """Stream the model's response into the GUI as it's generated (runs on a worker thread)"""
+        image_bytes = encode_future.result()
+        
+        # Don't send a request the user cancelled while it was queued or being prepared
+        if analysis_future.cancelled():
+            return
+        
+        stream = self.client.generate(
+            model=model,
+            prompt=prompt,
+            images=[image_bytes],
+            stream=True
+        )
+        
+        # Coalesce chunks so the Tk event queue gets at most one update per interval
+        pending = []
+        last_flush = time.monotonic()
         try:
-            # Encode image to base64
-            with open(self.selected_image_path, 'rb') as image_file:
-                image_base64 = base64.b64encode(image_file.read()).decode('utf-8')
+            for chunk in stream:
+                if analysis_future.cancelled():
+                    break
+                
+                pending.append(chunk['response'])
+                if time.monotonic() - last_flush >= STREAM_FLUSH_INTERVAL:
+                    self.root.after(0, self._append_response, analysis_future, ''.join(pending))
+                    pending = []
+                    last_flush = time.monotonic()
+        finally:
+            # Closing the stream early drops the connection, which stops generation;
+            # a cancel is only seen here once the first chunk has arrived
+            stream.close()
+        
+        if pending:
+            self.root.after(0, self._append_response, analysis_future, ''.join(pending))
+    
+    def _append_response(self, analysis_future, text):
+        """Append streamed response text (runs on the Tk main thread)"""
+        if analysis_future is not self._current_future:
+            return
+        
+        # Replace the "please wait" placeholder with the first chunk
+        if not self._response_started:
+            self.response_text.delete(1.0, tk.END)
+            self._response_started = True
+        
+        self.response_text.insert(tk.END, text)
+        self.response_text.see(tk.END)
+    
+    def analyze_batch(self, image_paths, prompt, model):
+        """Queue several images for analysis on a single background consumer"""
+        batch_queue = queue.Queue()
+        for image_path in image_paths:
+            batch_queue.put(image_path)
+        
+        # Tracks the whole batch for the GUI; cancelling it tells the consumer to stop
+        batch_future = concurrent.futures.Future()
+        self._current_future = batch_future
+        self._response_started = False
+        
+        threading.Thread(target=self._run_batch, 
+                         args=(batch_queue, prompt, model, batch_future), 
+                         daemon=True).start()
+    
+    def _run_batch(self, batch_queue, prompt, model, batch_future):
+        """Consume the batch queue, preparing the next image while the current one infers"""
+        # Fire concurrent requests only if the server is set up to run them in parallel
+        workers = min(batch_queue.qsize(), ollama_num_parallel())
+        
+        # Images are prepared on the pool, one ahead; generate calls run on daemon
+        # threads so abandoned requests can't keep the app alive at exit
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+            def prepare_next():
+                try:
+                    image_path = batch_queue.get_nowait()
+                except queue.Empty:
+                    return None
+                return image_path, pool.submit(self._prepare_image_for_model, image_path, model)
             
-            # Get the selected model name directly
-            selected_model = self.model_var.get().strip()
+            next_item = prepare_next()
+            in_flight = deque()
             
-            print(f"DEBUG - Using model: '{selected_model}' (type: {type(selected_model)})")
+            while (next_item or in_flight) and not batch_future.cancelled():
+                # Keep the inference slots busy; each submit starts preparing the image after it
+                while next_item and len(in_flight) < workers:
+                    image_path, prepare_future = next_item
+                    in_flight.append((image_path, submit_daemon(self._run_infer, prepare_future, 
+                                                                prompt, model, batch_future)))
+                    next_item = prepare_next()
+                
+                # Report results in the order the images were dropped
+                image_path, infer_future = in_flight.popleft()
+                try:
+                    text = infer_future.result()['response']
+                except Exception as e:
+                    log.debug("Analysis error for %s: %s", image_path, e)
+                    text = f"❌ Error: {e}"
+                
+                self.root.after(0, self._append_batch_result, batch_future, image_path, text)
             
-            # Send to vision model
-            response = self.client.generate(
-                model=selected_model,
-                prompt=prompt,
-                images=[image_base64],
-                stream=False
-            )
+            if batch_future.cancelled():
+                for _, pending_future in in_flight:
+                    pending_future.cancel()
+                if next_item:
+                    next_item[1].cancel()
+        
+        self.root.after(0, self._on_batch_done, batch_future)
+    
+    def _append_batch_result(self, batch_future, image_path, text):
+        """Add one image's result to the response area under a filename header"""
+        if batch_future is not self._current_future:
+            return
+        
+        # Replace the "please wait" placeholder with the first result
+        if not self._response_started:
+            self.response_text.delete(1.0, tk.END)
+            self._response_started = True
+        else:
+            self.response_text.insert(tk.END, "\n\n")
+        
+        self.response_text.insert(tk.END, f"===== {os.path.basename(image_path)} =====\n{text}")
+        self.response_text.see(tk.END)
+    
+    def _on_batch_done(self, batch_future):
+        """Reset the UI once every image in the batch has been analyzed"""
+        if batch_future is not self._current_future:
+            return
+        self._current_future = None
+        
+        self.update_status("✅ Batch analysis complete!")
+        self.analysis_complete()
+    
+    def _on_infer_done(self, analysis_future, future):
+        """Finish a streamed analysis (runs on the Tk main thread)"""
+        # Ignore results of analyses that were cancelled or superseded
+        if analysis_future is not self._current_future:
+            return
+        self._current_future = None
+        
+        try:
+            future.result()
             
-            # Update UI with response
-            self.root.after(0, self.display_response, response['response'])
+            # Nothing was streamed, so the "please wait" placeholder is still showing
+            if not self._response_started:
+                self.response_text.delete(1.0, tk.END)
+            self.update_status("✅ Analysis complete!")
             
         except Exception as e:
-            print(f"DEBUG - Analysis error: {e}")
-            self.root.after(0, self.display_error, str(e))
+            log.debug("Analysis error: %s", e)
+            self.display_error(str(e))
         
         finally:
-            # Hide progress and re-enable button
-            self.root.after(0, self.analysis_complete)
+            # Hide progress and restore the analyze button
+            self.analysis_complete()
     
-    def display_response(self, response):
-        """Display the model's response"""
+    def cancel_analysis(self):
+        """Cancel the analysis in progress and discard its result"""
+        if self._current_future is None:
+            return
+        
+        # Workers check the cancelled future and stop; a streamed response is
+        # closed at its next chunk, any other request already sent to Ollama
+        # is discarded
+        self._current_future.cancel()
+        self._current_future = None
+        
         self.response_text.delete(1.0, tk.END)
-        self.response_text.insert(tk.END, response)
-        self.update_status("✅ Analysis complete!")
+        self.response_text.insert(tk.END, "Analysis cancelled.")
+        self.update_status("✖ Analysis cancelled")
+        self.analysis_complete()
     
     def display_error(self, error_msg):
         """Display an error message"""
@@ -493,6 +914,13 @@ class VisionModelGUI:
             self.root.clipboard_append(response)
             self.update_status("📋 Response copied to clipboard!")
     
+    def on_close(self):
+        """Stop pending work and close the application"""
+        if self._current_future is not None:
+            self._current_future.cancel()
+        self._executor.shutdown(wait=False)
+        self.root.destroy()
+    
     def update_status(self, message):
         """Update the window title with status message"""
         self.root.title(f"Ollama Vision Model Analyzer - {message}")
@@ -500,6 +928,8 @@ class VisionModelGUI:
 
 def main():
     """Main function to run the GUI application"""
+    logging.basicConfig(level=logging.INFO)
+    
     if DND_AVAILABLE:
         root = TkinterDnD.Tk()
     else: